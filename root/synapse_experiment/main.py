@@ -1,25 +1,27 @@
-import pandas as pd
-import numpy as np
-import yaml
-from pathlib import Path
+"""
+Command-line entry point for the SYNAPSE synthetic experiment.
 
-import src.simulation.map as sim_map
-from src.agents.static_agent import StaticAgent
-from src.agents.synapse_agent import SYNAPSEAgent
-import src.analysis.metrics as metrics
-import src.analysis.reporting as reporting
-from src.analysis.path_analyzer import analyze_path
+Heavy dependencies (numpy, pandas, yaml, shapely, radon) are imported inside
+the code paths that use them, so `--help`, `report` and spawned workers only
+pay for what they actually touch.
+"""
+import argparse
+from pathlib import Path
 
 CONFIG_PATH = Path(__file__).parent / "config.yml"
+DEFAULT_OUTPUT_DIR = "results"
 
-def load_config() -> dict:
+def load_config(config_path: Path = CONFIG_PATH) -> dict:
     """Loads the YAML configuration file."""
-    with open(CONFIG_PATH, 'r') as f:
+    import yaml
+    with open(config_path, 'r') as f:
         config = yaml.safe_load(f)
     return config
 
 def generate_experiment_suite(config: dict) -> list[dict]:
     """Generates a list of scenario configurations based on the main config."""
+    import numpy as np
+
     num_scenarios = config['num_scenarios']
     gen_params = config['scenario_generation']
     split = gen_params['split']
@@ -92,6 +94,9 @@ def normalize_results(all_run_results: list[dict]) -> list[dict]:
 
 def run_single_scenario(scenario_params: dict, agents: list) -> list[dict]:
     """Runs the full experiment for a single scenario configuration."""
+    import src.simulation.map as sim_map
+    from src.analysis.path_analyzer import analyze_path
+
     print(f"  Running Scenario: {scenario_params.get('id', 'N/A')}...")
     
     scenario_map = sim_map.generate_scenario(scenario_params)
@@ -116,11 +121,39 @@ def run_single_scenario(scenario_params: dict, agents: list) -> list[dict]:
     return results
 
 
-def run_experiment():
+def score_results(all_results: list[dict], config: dict):
+    """Adds normalized performance, SRS and PPS to each result in place."""
+    import src.analysis.metrics as metrics
+
+    # --- Phase 4: Calculate SRS and Normalize ---
+    print("\nPhase 4: Calculating SRS and normalizing results...")
+    raw_perf_data = [res['raw_perf'] for res in all_results]
+    normalized_perf = normalize_results(raw_perf_data)
+    
+    for i, result in enumerate(all_results):
+        result['normalized_perf'] = normalized_perf[i]
+        agent_code_path = f"src/agents/{result['agent'].lower().replace('agent', '_agent')}.py"
+        result['srs'] = metrics.calculate_srs(agent_code_path, config['srs_weights'])
+
+    # --- Phase 5: Calculate Final PPS ---
+    print("\nPhase 5: Calculating final PPS...")
+    for result in all_results:
+        result['pps'] = metrics.calculate_pps(result['normalized_perf'], config['final_pps_weights'])
+
+
+def run_experiment(config_path: Path = CONFIG_PATH, num_scenarios: int | None = None, output_dir: str = DEFAULT_OUTPUT_DIR):
     """
     Main entry point for running the SYNAPSE synthetic experiment.
     """
-    config = load_config()
+    import numpy as np
+
+    import src.analysis.reporting as reporting
+    from src.agents.static_agent import StaticAgent
+    from src.agents.synapse_agent import SYNAPSEAgent
+
+    config = load_config(config_path)
+    if num_scenarios is not None:
+        config['num_scenarios'] = num_scenarios
     np.random.seed(config['random_seed'])
     
     print("SYNAPSE Synthetic Experiment")
@@ -142,28 +175,114 @@ def run_experiment():
         all_results.extend(scenario_results)
     print("All scenarios complete.")
 
-    # --- Phase 4: Calculate SRS and Normalize ---
-    print("\nPhase 4: Calculating SRS and normalizing results...")
-    raw_perf_data = [res['raw_perf'] for res in all_results]
-    normalized_perf = normalize_results(raw_perf_data)
-    
-    for i, result in enumerate(all_results):
-        result['normalized_perf'] = normalized_perf[i]
-        agent_code_path = f"src/agents/{result['agent'].lower().replace('agent', '_agent')}.py"
-        result['srs'] = metrics.calculate_srs(agent_code_path, config['srs_weights'])
-
-    # --- Phase 5: Calculate Final PPS ---
-    print("\nPhase 5: Calculating final PPS...")
-    for result in all_results:
-        result['pps'] = metrics.calculate_pps(result['normalized_perf'], config['final_pps_weights'])
+    score_results(all_results, config)
 
     # --- Phase 6: Generate Report ---
     print("\nPhase 6: Generating final report...")
-    reporting.generate_report(all_results)
+    reporting.generate_report(all_results, output_dir)
     
     print("=" * 30)
     print("Experiment finished.")
 
 
+def rescore_experiment(results_path: Path, config_path: Path = CONFIG_PATH, output_dir: str = DEFAULT_OUTPUT_DIR):
+    """
+    Recomputes SRS and PPS for a previously generated results CSV using the
+    current config weights, without re-running any scenarios.
+    """
+    import src.analysis.reporting as reporting
+
+    config = load_config(config_path)
+    all_results = reporting.load_results(results_path)
+    print(f"Loaded {len(all_results)} results from {results_path}.")
+    score_results(all_results, config)
+
+    print("\nGenerating rescored report...")
+    reporting.generate_report(all_results, output_dir)
+
+
+def run_benchmark(config_path: Path = CONFIG_PATH, num_scenarios: int = 5, repeat: int = 1):
+    """Times each agent's solve() over a small scenario suite."""
+    import contextlib
+    import io
+    import time
+
+    import numpy as np
+
+    import src.simulation.map as sim_map
+    from src.agents.static_agent import StaticAgent
+    from src.agents.synapse_agent import SYNAPSEAgent
+
+    config = load_config(config_path)
+    config['num_scenarios'] = num_scenarios
+    np.random.seed(config['random_seed'])
+    scenarios = generate_experiment_suite(config)
+    maps = [sim_map.generate_scenario(params) for params in scenarios]
+
+    timings = {}
+    for agent in [StaticAgent(), SYNAPSEAgent()]:
+        # Agents print per-solve progress; swallow it so only pathfinding is timed.
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for scenario_map in maps:
+                    agent.solve(scenario_map)
+            timings[agent.name] = time.perf_counter() - start
+
+    solves = len(maps) * repeat
+    print("=" * 30)
+    for name, elapsed in timings.items():
+        per_solve = elapsed / solves if solves else 0.0
+        print(f"{name}: {elapsed:.3f}s total, {per_solve * 1000:.1f}ms per solve ({solves} solves)")
+
+
+def show_report(results_path: Path):
+    """Prints per-agent and per-scenario-type averages for a results CSV."""
+    import src.analysis.reporting as reporting
+    print(reporting.summarize_report(results_path).to_string())
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the command-line parser for the experiment subcommands."""
+    parser = argparse.ArgumentParser(description="SYNAPSE synthetic experiment.")
+    subparsers = parser.add_subparsers(dest='command')
+
+    run_parser = subparsers.add_parser('run', help="Run the full experiment (default).")
+    run_parser.add_argument('--config', type=Path, default=CONFIG_PATH, help="Path to the YAML config.")
+    run_parser.add_argument('--num-scenarios', type=int, help="Override num_scenarios from the config.")
+    run_parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help="Directory for the results CSV.")
+
+    rescore_parser = subparsers.add_parser('rescore', help="Recompute SRS/PPS for an existing results CSV.")
+    rescore_parser.add_argument('results', type=Path, help="Results CSV produced by 'run'.")
+    rescore_parser.add_argument('--config', type=Path, default=CONFIG_PATH, help="Path to the YAML config.")
+    rescore_parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help="Directory for the rescored CSV.")
+
+    bench_parser = subparsers.add_parser('bench', help="Time agent pathfinding on a few scenarios.")
+    bench_parser.add_argument('--config', type=Path, default=CONFIG_PATH, help="Path to the YAML config.")
+    bench_parser.add_argument('--num-scenarios', type=int, default=5, help="Number of scenarios to time.")
+    bench_parser.add_argument('--repeat', type=int, default=1, help="Number of passes over the scenarios.")
+
+    report_parser = subparsers.add_parser('report', help="Summarize an existing results CSV.")
+    report_parser.add_argument('results', type=Path, help="Results CSV produced by 'run' or 'rescore'.")
+
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    """Parses command-line arguments and dispatches to the chosen subcommand."""
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'rescore':
+        rescore_experiment(args.results, args.config, args.output_dir)
+    elif args.command == 'bench':
+        run_benchmark(args.config, args.num_scenarios, args.repeat)
+    elif args.command == 'report':
+        show_report(args.results)
+    elif args.command == 'run':
+        run_experiment(args.config, args.num_scenarios, args.output_dir)
+    else:
+        run_experiment()
+
+
 if __name__ == "__main__":
-    run_experiment() 
\ No newline at end of file
+    main()
@@ -2,7 +2,7 @@ from .base_agent import BaseAgent
 from ..simulation.map import Map
 from ..utils.pathfinding import astar_search
 from ..utils.geometry import euclidean_distance
-from shapely.geometry import Point, LineString
+from shapely.geometry import LineString
 from ..analysis.path_analyzer import analyze_path
 
 class SYNAPSEAgent(BaseAgent):
@@ -41,11 +41,7 @@ class SYNAPSEAgent(BaseAgent):
         
         # Risk-aware component
         safety_weight = weights.get('safety', 0.1)
-        min_dist_to_obstacle = float('inf')
-        
-        current_point = Point(pos)
-        for obs in problem_map.obstacles:
-            min_dist_to_obstacle = min(min_dist_to_obstacle, current_point.distance(obs))
+        min_dist_to_obstacle = problem_map.clearance_at(pos)
             
         # Add a penalty for being too close to obstacles.
         # The penalty is higher when the safety weight is higher.
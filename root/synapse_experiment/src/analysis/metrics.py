@@ -1,4 +1,3 @@
-import radon.complexity as radon_complexity
 # We'll use pytest-cov programmatically later, for now this is a placeholder.
 
 def calculate_pps(results: dict, weights: dict) -> float:
@@ -31,6 +30,8 @@ def calculate_srs(code_path: str, weights: dict) -> float:
     Returns:
         float: The calculated SRS.
     """
+    import radon.complexity as radon_complexity
+
     # Weights for complexity, coverage, etc. from config
     alpha = weights.get('code_complexity', 0.5)
     beta = weights.get('test_coverage', 0.3)
@@ -1,7 +1,9 @@
-import pandas as pd
+import csv
 from datetime import datetime
 from pathlib import Path
 
+RAW_PERF_KEYS = ['time', 'energy', 'safety', 'payload_integrity']
+
 def generate_report(experiment_data: list, output_dir: str = "results"):
     """
     Generates a CSV report from the experiment data, flattening nested dictionaries.
@@ -10,6 +12,8 @@ def generate_report(experiment_data: list, output_dir: str = "results"):
         experiment_data (list): A list of dictionaries from the experiment run.
         output_dir (str): The directory to save the output CSV file in.
     """
+    import pandas as pd
+
     if not experiment_data:
         print("No data to generate report.")
         return
@@ -62,6 +66,45 @@ def generate_report(experiment_data: list, output_dir: str = "results"):
     except Exception as e:
         print(f"Failed to generate report: {e}")
 
+def load_results(results_path: Path) -> list[dict]:
+    """
+    Loads a results CSV written by generate_report back into the experiment
+    data structure, keeping only the raw performance data needed to rescore.
+
+    Args:
+        results_path (Path): The CSV file to load.
+
+    Returns:
+        list: A list of dictionaries in the shape produced by the experiment run.
+    """
+    results = []
+    with open(results_path, 'r', newline='') as f:
+        for row in csv.DictReader(f):
+            results.append({
+                'scenario_id': row['scenario_id'],
+                'scenario_type': row['scenario_type'],
+                'agent': row['agent'],
+                'path_found': row.get('path_found') == 'True',
+                'raw_perf': {key: float(row[f'raw_{key}']) for key in RAW_PERF_KEYS},
+            })
+    return results
+
+def summarize_report(results_path: Path):
+    """
+    Averages PPS, SRS and normalized scores per agent and scenario type.
+
+    Args:
+        results_path (Path): The CSV file to summarize.
+
+    Returns:
+        DataFrame: The mean of each score, indexed by agent and scenario type.
+    """
+    import pandas as pd
+
+    df = pd.read_csv(results_path)
+    score_columns = [col for col in ['pps', 'srs'] + [f'norm_{key}' for key in RAW_PERF_KEYS] if col in df.columns]
+    return df.groupby(['agent', 'scenario_type'])[score_columns].mean()
+
 # Example Usage (can be called from main.py)
 def _example():
     # This example is now outdated due to the new data structure
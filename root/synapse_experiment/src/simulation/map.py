@@ -1,4 +1,5 @@
 import numpy as np
+import shapely
 from shapely.geometry import Polygon, Point, LineString
 
 class Map:
@@ -10,6 +11,17 @@ class Map:
         self.obstacles = obstacles
         self.start = start
         self.end = end
+        self._occupancy = None
+        self._clearance = None
+        self._distance_field = None
+        self._landmark_cache = {}
+
+    def __getstate__(self) -> dict:
+        # Derived grids are cheap to rebuild or attach from shared memory and
+        # can be megabytes each, so they are never pickled to workers.
+        state = self.__dict__.copy()
+        state.update(_occupancy=None, _clearance=None, _distance_field=None, _landmark_cache={})
+        return state
 
     def is_collision(self, point: Point) -> bool:
         """Checks if a point collides with any obstacle."""
@@ -22,6 +34,71 @@ class Map:
                 return True
         return False
 
+    def occupancy_grid(self) -> np.ndarray:
+        """
+        Returns a boolean grid of blocked integer cells, indexed [x, y].
+        Matches is_collision exactly and is computed once per map.
+        """
+        if self._occupancy is None:
+            xs, ys = self._cell_coords()
+            occupancy = np.zeros(xs.shape, dtype=bool)
+            for obs in self.obstacles:
+                occupancy |= shapely.contains_xy(obs, xs, ys)
+            self._occupancy = occupancy
+        return self._occupancy
+
+    def clearance_grid(self) -> np.ndarray:
+        """
+        Returns the Euclidean distance from each integer cell to the nearest
+        obstacle, indexed [x, y]. Cells are inf on a map without obstacles.
+        """
+        if self._clearance is None:
+            xs, ys = self._cell_coords()
+            if self.obstacles:
+                cells = shapely.points(xs, ys)
+                self._clearance = shapely.distance(shapely.union_all(self.obstacles), cells)
+            else:
+                self._clearance = np.full(xs.shape, np.inf)
+        return self._clearance
+
+    def clearance_at(self, pos: tuple[int, int]) -> float:
+        """Returns the distance from a position to the nearest obstacle."""
+        w, h = self.dimensions
+        if 0 <= pos[0] < w and 0 <= pos[1] < h and pos[0] == int(pos[0]) and pos[1] == int(pos[1]):
+            return float(self.clearance_grid()[int(pos[0]), int(pos[1])])
+        point = Point(pos)
+        return min((point.distance(obs) for obs in self.obstacles), default=float('inf'))
+
+    def distance_field(self) -> np.ndarray:
+        """
+        Returns the A* path cost from each free cell to the map's end point,
+        indexed [x, y]. Blocked and unreachable cells are inf.
+        """
+        if self._distance_field is None:
+            from ..utils.landmarks import dijkstra_distances
+            end = (int(self.end.x), int(self.end.y))
+            self._distance_field = dijkstra_distances(self.occupancy_grid(), end)
+        return self._distance_field
+
+    def _cell_coords(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the x and y coordinates of every integer cell, indexed [x, y]."""
+        return np.meshgrid(np.arange(self.dimensions[0]), np.arange(self.dimensions[1]), indexing='ij')
+
+    def layout_key(self) -> tuple:
+        """Returns a hashable key identifying the map's dimensions and obstacles."""
+        return (tuple(self.dimensions), tuple(obs.wkb for obs in self.obstacles))
+
+    def landmark_heuristic(self, num_landmarks: int = 8):
+        """
+        Returns the ALT heuristic for this map's obstacle layout. The landmark
+        distance tables are shared by every Map with the same layout, so
+        regenerating an identical scenario does not rebuild them.
+        """
+        from ..utils.landmarks import landmark_heuristic_for
+        if num_landmarks not in self._landmark_cache:
+            self._landmark_cache[num_landmarks] = landmark_heuristic_for(self, num_landmarks)
+        return self._landmark_cache[num_landmarks]
+
 def generate_scenario(params: dict) -> Map:
     """
     Generates a deterministic map scenario based on the specified type.
@@ -0,0 +1,153 @@
+import weakref
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Self
+
+import numpy as np
+
+from .map import Map
+
+# Map attributes that cache each derived grid, keyed by grid name.
+_GRID_ATTRS = {
+    'occupancy': '_occupancy',
+    'clearance': '_clearance',
+    'distance_field': '_distance_field',
+}
+
+@dataclass(frozen=True)
+class SharedGridHandle:
+    """Picklable reference to one grid living in a shared memory segment."""
+    name: str
+    shape: tuple
+    dtype: str
+
+@dataclass(frozen=True)
+class SharedMapHandle:
+    """
+    Picklable reference to all published grids of a map. Sending this to a
+    worker costs a few hundred bytes regardless of the map size.
+    """
+    dimensions: tuple
+    grids: dict
+
+    def attach(self, problem_map: Map | None = None) -> "AttachedMapGrids":
+        """Maps the shared grids into this process without copying them."""
+        return AttachedMapGrids(self, problem_map)
+
+class SharedMapGrids:
+    """
+    Publishes a map's occupancy, clearance and distance-field grids to shared
+    memory. The creating (parent) process owns the segments: call close(), or
+    use this as a context manager, once all workers are done with them.
+    """
+    def __init__(self, problem_map: Map):
+        self._segments = []
+        grids = {}
+        arrays = {
+            'occupancy': problem_map.occupancy_grid(),
+            'clearance': problem_map.clearance_grid(),
+            'distance_field': problem_map.distance_field(),
+        }
+        try:
+            for key, array in arrays.items():
+                segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._segments.append(segment)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+                grids[key] = SharedGridHandle(segment.name, array.shape, array.dtype.str)
+        except Exception:
+            self.close()
+            raise
+        self.handle = SharedMapHandle(tuple(problem_map.dimensions), grids)
+
+    def close(self):
+        """
+        Releases and unlinks every segment. Safe to call more than once; a
+        failure on one segment does not stop the others from being unlinked.
+        """
+        segments, self._segments = self._segments, []
+        errors = []
+        for segment in segments:
+            try:
+                try:
+                    segment.close()
+                finally:
+                    segment.unlink()
+            except OSError as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class AttachedMapGrids:
+    """
+    A worker's read-only view of published grids. If a Map is given, its grid
+    caches are pointed at the shared arrays so occupancy_grid() and friends
+    return them instead of recomputing. Call close() (or use this as a context
+    manager) when done; the parent remains responsible for unlinking.
+    """
+    def __init__(self, handle: SharedMapHandle, problem_map: Map | None = None):
+        self._finalizers = []
+        self._map = problem_map
+        self.grids = {}
+        try:
+            for key, grid in handle.grids.items():
+                self.grids[key] = self._attach_grid(grid)
+                if problem_map is not None:
+                    setattr(problem_map, _GRID_ATTRS[key], self.grids[key])
+        except Exception:
+            self.close()
+            raise
+
+    def _attach_grid(self, grid: SharedGridHandle) -> np.ndarray:
+        """
+        Maps one segment as a read-only array. The segment is unmapped only
+        once that array, and every view of it, has been garbage collected.
+        """
+        segment = shared_memory.SharedMemory(name=grid.name)
+        array = np.ndarray(grid.shape, dtype=np.dtype(grid.dtype), buffer=segment.buf)
+        array.flags.writeable = False
+        self._finalizers.append(weakref.finalize(array, segment.close))
+        return array
+
+    @property
+    def occupancy(self) -> np.ndarray:
+        return self.grids['occupancy']
+
+    @property
+    def clearance(self) -> np.ndarray:
+        return self.grids['clearance']
+
+    @property
+    def distance_field(self) -> np.ndarray:
+        return self.grids['distance_field']
+
+    def close(self):
+        """
+        Releases this view and clears the attached Map's grid caches, along
+        with anything it derived from them. Each segment stays mapped while a
+        caller still holds one of its arrays, e.g. from clearance_grid(), and
+        is unmapped as soon as the last such reference goes away.
+        """
+        if self._map is not None:
+            for key, array in self.grids.items():
+                if getattr(self._map, _GRID_ATTRS[key]) is array:
+                    setattr(self._map, _GRID_ATTRS[key], None)
+            self._map._landmark_cache = {}
+            self._map = None
+        self.grids = {}
+
+    @property
+    def detached(self) -> bool:
+        """True once every segment of this view has been unmapped."""
+        return not any(finalizer.alive for finalizer in self._finalizers)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,130 @@
+import heapq
+from collections import OrderedDict
+
+import numpy as np
+
+from ..simulation.map import Map
+
+# Same 8-connected move set and costs as astar_search, so landmark distances
+# are exact shortest-path costs on the graph A* actually explores.
+_MOVES = [(dx, dy, 1.414 if dx != 0 and dy != 0 else 1.0)
+          for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0)]
+
+# Heuristics shared across Map instances with identical layouts, keyed by
+# (layout_key, num_landmarks). Bounded so long suites do not grow it forever.
+_LAYOUT_CACHE_SIZE = 16
+_layout_cache = OrderedDict()
+
+def dijkstra_distances(occupancy: np.ndarray, source: tuple[int, int]) -> np.ndarray:
+    """
+    Computes shortest-path costs from `source` to every free cell of an
+    occupancy grid (indexed [x, y], True = blocked). Unreachable cells are inf,
+    as is every cell when the source itself is blocked or off the grid.
+    """
+    w, h = occupancy.shape
+    dist = np.full((w, h), np.inf)
+    if not (0 <= source[0] < w and 0 <= source[1] < h) or occupancy[source]:
+        return dist
+    dist[source] = 0.0
+    open_set = [(0.0, source)]
+
+    while open_set:
+        d, (x, y) = heapq.heappop(open_set)
+        if d > dist[x, y]:
+            continue
+        for dx, dy, cost in _MOVES:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < w and 0 <= ny < h) or occupancy[nx, ny]:
+                continue
+            nd = d + cost
+            if nd < dist[nx, ny]:
+                dist[nx, ny] = nd
+                heapq.heappush(open_set, (nd, (nx, ny)))
+
+    return dist
+
+def select_landmarks(occupancy: np.ndarray, num_landmarks: int) -> tuple[list, np.ndarray]:
+    """
+    Picks landmarks with farthest-point selection: each new landmark is the
+    free cell farthest (by path cost) from all landmarks chosen so far.
+
+    Returns:
+        The landmark cells and a (num_landmarks, w, h) array of their distances.
+    """
+    free_cells = np.argwhere(~occupancy)
+    if len(free_cells) == 0:
+        return [], np.empty((0,) + occupancy.shape)
+
+    # Seed from the first free cell in scan order; it is discarded once the
+    # first real landmark (the cell farthest from it) is found.
+    seed = tuple(int(c) for c in free_cells[0])
+    min_dist = dijkstra_distances(occupancy, seed)
+
+    landmarks = []
+    distances = []
+    for _ in range(num_landmarks):
+        candidates = np.where(np.isfinite(min_dist), min_dist, -1.0)
+        if landmarks:
+            candidates[tuple(np.array(landmarks).T)] = -1.0
+        if candidates.max() <= 0:
+            break
+        landmark = tuple(int(c) for c in np.unravel_index(np.argmax(candidates), candidates.shape))
+        dist = dijkstra_distances(occupancy, landmark)
+        if not landmarks:
+            min_dist = dist.copy()
+        else:
+            min_dist = np.minimum(min_dist, dist)
+        landmarks.append(landmark)
+        distances.append(dist)
+
+    if not distances:
+        return [], np.empty((0,) + occupancy.shape)
+    return landmarks, np.stack(distances)
+
+class LandmarkHeuristic:
+    """
+    ALT (A*, Landmarks, Triangle inequality) heuristic for a fixed map layout.
+
+    For every landmark L, |d(L, goal) - d(L, pos)| is a lower bound on the
+    path cost from pos to goal; the heuristic is the largest such bound. It is
+    admissible and consistent, so it can be passed straight to astar_search
+    for any start/goal pair on the same obstacle layout.
+    """
+    def __init__(self, problem_map: Map, num_landmarks: int = 8):
+        # Only the freshly computed distance tables are kept, never the map's
+        # occupancy grid, which may be a view into memory owned elsewhere.
+        self.landmarks, self.distances = select_landmarks(problem_map.occupancy_grid(), num_landmarks)
+        self._shape = self.distances.shape[1:]
+        self._goal = None
+        self._goal_dist = None
+
+    def _in_grid(self, cell: tuple[int, int]) -> bool:
+        return 0 <= cell[0] < self._shape[0] and 0 <= cell[1] < self._shape[1]
+
+    def __call__(self, pos: tuple[int, int], end: tuple[int, int]) -> float:
+        # Cells outside the grid have no table entries; 0.0 is always admissible.
+        if not (self._in_grid(pos) and self._in_grid(end)):
+            return 0.0
+        if end != self._goal:
+            self._goal = end
+            self._goal_dist = self.distances[:, end[0], end[1]]
+        bounds = np.abs(self._goal_dist - self.distances[:, pos[0], pos[1]])
+        # inf - inf (landmark reaches neither cell) yields nan; inf means the
+        # cells lie in different components, which A* discovers on its own.
+        bounds = bounds[np.isfinite(bounds)]
+        return float(bounds.max()) if bounds.size else 0.0
+
+def landmark_heuristic_for(problem_map: Map, num_landmarks: int = 8) -> LandmarkHeuristic:
+    """
+    Returns the ALT heuristic for the map's obstacle layout, reusing the one
+    built for any earlier Map with the same dimensions and obstacles.
+    """
+    key = (problem_map.layout_key(), num_landmarks)
+    if key in _layout_cache:
+        _layout_cache.move_to_end(key)
+        return _layout_cache[key]
+    heuristic = LandmarkHeuristic(problem_map, num_landmarks)
+    _layout_cache[key] = heuristic
+    if len(_layout_cache) > _LAYOUT_CACHE_SIZE:
+        _layout_cache.popitem(last=False)
+    return heuristic
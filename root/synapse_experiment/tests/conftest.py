@@ -0,0 +1,34 @@
+import math
+
+import pytest
+
+from src.analysis.reporting import generate_report
+
+
+@pytest.fixture
+def experiment_data() -> list[dict]:
+    """Two scenarios, two agents; SYNAPSEAgent's holdout run found no path."""
+    rows = []
+    for scenario_id, scenario_type in [('training_1', 'training'), ('holdout_1', 'holdout')]:
+        for agent, offset in [('StaticAgent', 0.0), ('SYNAPSEAgent', 0.5)]:
+            rows.append({
+                'scenario_id': scenario_id,
+                'scenario_type': scenario_type,
+                'agent': agent,
+                'path_found': True,
+                'srs': 0.25,
+                'pps': 0.5 + offset / 2,
+                'raw_perf': {'time': 40.0 + offset, 'energy': 40.0 + offset, 'safety': 3.0, 'payload_integrity': 1.0},
+                'normalized_perf': {'time': offset, 'energy': offset, 'safety': 1.0, 'payload_integrity': 0.5},
+            })
+    failed = {'time': math.inf, 'energy': math.inf, 'safety': math.inf, 'payload_integrity': math.inf}
+    rows[-1].update(path_found=False, raw_perf=failed)
+    return rows
+
+
+@pytest.fixture
+def report_csv(tmp_path, experiment_data):
+    """Writes experiment_data with generate_report and returns the CSV path."""
+    output_dir = tmp_path / 'report'
+    generate_report(experiment_data, str(output_dir))
+    return next(output_dir.glob('experiment_results_*.csv'))
@@ -0,0 +1,89 @@
+import heapq
+import itertools
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from shapely.geometry import Point, Polygon
+
+from src.simulation.map import Map, generate_scenario
+from src.utils import pathfinding
+from src.utils.geometry import euclidean_distance
+from src.utils.landmarks import dijkstra_distances
+from src.utils.pathfinding import astar_search
+
+SCENARIO_TYPES = ['deterministic_trap', 'deterministic_high_risk', 'deterministic_low_risk']
+
+def _walled_map() -> Map:
+    """A map whose two thick walls force a long detour between the corners."""
+    obstacles = [
+        Polygon([(10, -1), (14, -1), (14, 40), (10, 40)]),
+        Polygon([(25, 10), (29, 10), (29, 51), (25, 51)]),
+    ]
+    return Map((50, 50), obstacles, Point(2, 2), Point(45, 2))
+
+def _path_cost(path: list) -> float:
+    return sum(1.414 if a[0] != b[0] and a[1] != b[1] else 1.0 for a, b in itertools.pairwise(path))
+
+def _count_expansions(monkeypatch, *args) -> tuple[list, int]:
+    """Runs astar_search and counts the nodes it pops from its open set."""
+    pops = [0]
+    def heappop(heap):
+        pops[0] += 1
+        return heapq.heappop(heap)
+    monkeypatch.setattr(pathfinding, 'heapq', SimpleNamespace(heappush=heapq.heappush, heappop=heappop))
+    paths = astar_search(*args)
+    monkeypatch.undo()
+    return paths, pops[0]
+
+@pytest.mark.parametrize('scenario_type', [*SCENARIO_TYPES, 'walled'])
+def test_landmark_heuristic_is_admissible_and_expands_fewer_nodes(monkeypatch, scenario_type):
+    if scenario_type == 'walled':
+        problem_map = _walled_map()
+    else:
+        problem_map = generate_scenario({'type': scenario_type, 'dimensions': (60, 60)})
+    occupancy = problem_map.occupancy_grid()
+    heuristic = problem_map.landmark_heuristic()
+    free = [tuple(int(c) for c in cell) for cell in np.argwhere(~occupancy)]
+
+    rng = random.Random(0)
+    euclid_expansions = landmark_expansions = 0
+    for _ in range(5):
+        start, goal = rng.sample(free, 2)
+        true_cost = dijkstra_distances(occupancy, goal)
+        assert all(heuristic(cell, goal) <= true_cost[cell] + 1e-9 for cell in free[::5])
+
+        euclid_paths, euclid_pops = _count_expansions(monkeypatch, problem_map, start, goal, euclidean_distance)
+        landmark_paths, landmark_pops = _count_expansions(monkeypatch, problem_map, start, goal, heuristic)
+        assert bool(euclid_paths) == bool(landmark_paths)
+        if landmark_paths:
+            assert _path_cost(landmark_paths[0]) == pytest.approx(true_cost[start])
+            assert _path_cost(landmark_paths[0]) == pytest.approx(_path_cost(euclid_paths[0]))
+        euclid_expansions += euclid_pops
+        landmark_expansions += landmark_pops
+
+    # Judged over all pairs: on open ground ALT's flat f-values can make a
+    # single query expand more, and the scenarios' default start/goal rows
+    # see no gain at all.
+    assert landmark_expansions < euclid_expansions
+
+def test_landmark_heuristic_handles_cells_outside_grid():
+    heuristic = _walled_map().landmark_heuristic(4)
+    assert heuristic((2, 2), (60, 2)) == 0.0
+    assert heuristic((-1, 2), (45, 2)) == 0.0
+    assert heuristic((2, 2), (45, -3)) == 0.0
+    assert heuristic((2, 2), (45, 2)) > euclidean_distance((2, 2), (45, 2))
+
+def test_dijkstra_from_blocked_source_is_unreachable():
+    occupancy = _walled_map().occupancy_grid()
+    assert occupancy[12, 5]
+    assert np.isinf(dijkstra_distances(occupancy, (12, 5))).all()
+
+def test_landmark_tables_are_shared_by_identical_layouts():
+    params = {'type': 'deterministic_trap', 'dimensions': (60, 60)}
+    first = generate_scenario(params).landmark_heuristic(3)
+    second = generate_scenario(params).landmark_heuristic(3)
+    other = generate_scenario({'type': 'deterministic_low_risk', 'dimensions': (60, 60)}).landmark_heuristic(3)
+    assert first is second
+    assert other is not first
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import main
+from src.analysis.reporting import load_results
+
+PROJECT_DIR = Path(main.__file__).parent
+
+def test_report_subcommand_prints_summary(report_csv, capsys):
+    main.main(['report', str(report_csv)])
+
+    output = capsys.readouterr().out
+    assert 'SYNAPSEAgent' in output
+    assert 'norm_payload_integrity' in output
+
+def test_rescore_subcommand_writes_new_report(tmp_path, report_csv):
+    output_dir = tmp_path / 'rescored'
+    main.main(['rescore', str(report_csv), '--output-dir', str(output_dir)])
+
+    rescored_path = next(output_dir.glob('experiment_results_*.csv'))
+    original, rescored = load_results(report_csv), load_results(rescored_path)
+    assert [row['raw_perf'] for row in rescored] == [row['raw_perf'] for row in original]
+    with open(rescored_path) as f:
+        header = f.readline().strip().split(',')
+    assert header[:5] == ['scenario_id', 'scenario_type', 'agent', 'pps', 'srs']
+
+def test_import_main_does_not_load_heavy_modules():
+    code = (
+        "import sys, main; "
+        "print(','.join(m for m in ('pandas', 'numpy', 'radon', 'yaml', 'shapely') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
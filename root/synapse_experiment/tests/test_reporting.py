@@ -0,0 +1,20 @@
+import math
+
+from src.analysis.reporting import load_results, summarize_report
+
+
+def test_load_results_round_trips_raw_perf(experiment_data, report_csv):
+    loaded = load_results(report_csv)
+
+    assert [row['raw_perf'] for row in loaded] == [row['raw_perf'] for row in experiment_data]
+    assert math.isinf(loaded[-1]['raw_perf']['time'])
+    assert [row['path_found'] for row in loaded] == [True, True, True, False]
+    assert [(row['scenario_id'], row['agent']) for row in loaded] == [(row['scenario_id'], row['agent']) for row in experiment_data]
+
+def test_summarize_report_averages_scores_per_agent(report_csv):
+    summary = summarize_report(report_csv)
+
+    assert list(summary.columns) == ['pps', 'srs', 'norm_time', 'norm_energy', 'norm_safety', 'norm_payload_integrity']
+    assert list(summary.index.names) == ['agent', 'scenario_type']
+    assert summary.loc[('SYNAPSEAgent', 'holdout'), 'pps'] == 0.75
+    assert summary.loc[('StaticAgent', 'training'), 'norm_time'] == 0.0
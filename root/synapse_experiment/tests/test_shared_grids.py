@@ -0,0 +1,107 @@
+import multiprocessing
+import pickle
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from src.simulation.map import generate_scenario
+from src.simulation.shared_grids import SharedMapGrids
+
+PARAMS = {'type': 'deterministic_low_risk', 'dimensions': (60, 60)}
+
+def _summarize_in_worker(handle, problem_map):
+    """Runs in a pool worker: attaches the shared grids to a pickled Map."""
+    assert problem_map._occupancy is None
+    with handle.attach(problem_map) as grids:
+        assert not grids.occupancy.flags.writeable
+        assert problem_map.occupancy_grid() is grids.occupancy
+        summary = (
+            int(problem_map.occupancy_grid().sum()),
+            float(problem_map.clearance_at((5, 5))),
+            float(problem_map.distance_field()[5, 5]),
+        )
+    assert problem_map._occupancy is None
+    return summary
+
+def _segments_exist(handle) -> bool:
+    try:
+        segment = shared_memory.SharedMemory(name=next(iter(handle.grids.values())).name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    return True
+
+def test_pool_round_trip_and_cleanup():
+    problem_map = generate_scenario(PARAMS)
+    expected = (
+        int(problem_map.occupancy_grid().sum()),
+        float(problem_map.clearance_at((5, 5))),
+        float(problem_map.distance_field()[5, 5]),
+    )
+    with SharedMapGrids(problem_map) as shared:
+        handle = shared.handle
+        with multiprocessing.get_context('spawn').Pool(2) as pool:
+            results = pool.starmap(_summarize_in_worker, [(handle, problem_map)] * 3)
+        assert _segments_exist(handle)
+    assert results == [expected] * 3
+    assert not _segments_exist(handle)
+
+def test_pickled_map_drops_derived_grids():
+    problem_map = generate_scenario({'type': 'deterministic_low_risk', 'dimensions': (200, 200)})
+    bare_size = len(pickle.dumps(problem_map))
+    problem_map.landmark_heuristic(2)
+    with SharedMapGrids(problem_map):
+        assert len(pickle.dumps(problem_map)) == bare_size
+    clone = pickle.loads(pickle.dumps(problem_map))
+    assert np.array_equal(clone.occupancy_grid(), problem_map.occupancy_grid())
+
+def test_close_drops_caches_derived_from_shared_arrays():
+    parent_map = generate_scenario(PARAMS)
+    with SharedMapGrids(parent_map) as shared:
+        worker_map = pickle.loads(pickle.dumps(parent_map))
+        grids = shared.handle.attach(worker_map)
+        heuristic = worker_map.landmark_heuristic(2)
+        grids.close()
+
+        assert worker_map._landmark_cache == {}
+        assert worker_map._occupancy is None
+        assert heuristic((5, 5), (45, 45)) >= 0.0
+        assert worker_map.occupancy_grid().sum() == parent_map.occupancy_grid().sum()
+        assert worker_map.landmark_heuristic(2)((5, 5), (45, 45)) == heuristic((5, 5), (45, 45))
+
+def test_failed_attach_releases_segments():
+    problem_map = generate_scenario(PARAMS)
+    shared = SharedMapGrids(problem_map)
+    handle = shared.handle
+    last = list(handle.grids.values())[-1]
+    stale = shared_memory.SharedMemory(name=last.name)
+    stale.close()
+    stale.unlink()
+
+    worker_map = pickle.loads(pickle.dumps(problem_map))
+    with pytest.raises(FileNotFoundError):
+        handle.attach(worker_map)
+    assert worker_map._occupancy is None
+    assert worker_map._clearance is None
+
+    with pytest.raises(FileNotFoundError):
+        shared.close()
+    assert not _segments_exist(handle)
+
+def test_grid_kept_past_close_stays_readable():
+    parent_map = generate_scenario(PARAMS)
+    expected = float(parent_map.clearance_grid().sum())
+    with SharedMapGrids(parent_map) as shared:
+        worker_map = pickle.loads(pickle.dumps(parent_map))
+        grids = shared.handle.attach(worker_map)
+        clearance = worker_map.clearance_grid()
+        corner = grids.occupancy[:5, :5]
+        grids.close()
+
+        assert not grids.detached
+        assert float(clearance.sum()) == expected
+        assert not corner.any()
+
+        del clearance, corner
+        assert grids.detached